@@ -7,6 +7,7 @@ This module defines the data structures used to represent:
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass
@@ -82,6 +83,8 @@ class RunResult:
     """Result of running a single prompt.
 
     Contains parsed events and convenience accessors for common operations.
+    Event-filtering accessors are computed on first access and cached, since
+    events are complete once the run has finished.
 
     Attributes:
         events: List of SSE events received
@@ -95,17 +98,17 @@ class RunResult:
     success: bool
     stderr: str
 
-    @property
+    @cached_property
     def tool_calls(self) -> list[JsonEvent]:
         """Get all tool call events (tool_call and tool_auto_approved)."""
         return get_tool_calls(self.events)
 
-    @property
+    @cached_property
     def tool_results(self) -> list[JsonEvent]:
         """Get all tool_result events."""
         return get_tool_results(self.events)
 
-    @property
+    @cached_property
     def completed_event(self) -> JsonEvent | None:
         """Get the completed event if present."""
         for event in reversed(self.events):
@@ -113,7 +116,7 @@ class RunResult:
                 return event
         return None
 
-    @property
+    @cached_property
     def error_event(self) -> JsonEvent | None:
         """Get the error event if present."""
         for event in reversed(self.events):
@@ -157,6 +157,24 @@ class QbitClient:
         resp = await self.client.delete(f"{self.base_url}/sessions/{session_id}")
         return resp.status_code == 204
 
+    async def flush_sidecar(self, session_id: str) -> None:
+        """Wait for the session's sidecar to process all captured events.
+
+        Blocks until state.md/log.md reflect every event captured so far,
+        replacing fixed sleeps before inspecting sidecar files.
+
+        Args:
+            session_id: Session whose sidecar should be flushed
+
+        Raises:
+            httpx.HTTPStatusError: If the flush failed (e.g., unknown session),
+                so callers never go on to race the sidecar processor
+        """
+        resp = await self.client.post(
+            f"{self.base_url}/sessions/{session_id}/sidecar/flush"
+        )
+        resp.raise_for_status()
+
     async def execute(
         self,
         session_id: str,
@@ -76,6 +76,42 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(skip_api)
 
 
+# =============================================================================
+# Server Readiness
+# =============================================================================
+
+
+def wait_for_server_health(base_url: str, timeout: float = 15.0) -> bool:
+    """Poll the server's /health endpoint until it responds with 200.
+
+    Starts at a 10ms interval and doubles it after each failed check (up to
+    0.5s), so a server that is already up is detected almost immediately.
+
+    Args:
+        base_url: Server base URL (e.g., "http://127.0.0.1:54321")
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the server became healthy, False if the timeout expired.
+    """
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        try:
+            resp = httpx.get(f"{base_url}/health", timeout=1.0)
+            if resp.status_code == 200:
+                return True
+        except httpx.RequestError:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.5)
+
+
 # =============================================================================
 # DeepEval Model Fixture
 # =============================================================================
@@ -128,8 +164,6 @@ def qbit_server_info():
     Yields:
         Base URL string (e.g., "http://127.0.0.1:54321")
     """
-    import httpx
-
     binary_path = get_binary_path()
     if not os.path.exists(binary_path):
         pytest.skip(f"Binary not found at {binary_path}. Run: just build-server")
@@ -171,15 +205,7 @@ def qbit_server_info():
         base_url = f"http://{host}:{port}"
 
         # Wait for server to be ready
-        for _ in range(30):
-            try:
-                resp = httpx.get(f"{base_url}/health", timeout=1.0)
-                if resp.status_code == 200:
-                    break
-            except httpx.RequestError:
-                pass
-            time.sleep(0.5)
-        else:
+        if not wait_for_server_health(base_url):
             proc.terminate()
             pytest.fail("Server did not become ready within 15 seconds")
 
@@ -199,7 +225,11 @@ async def qbit_server(qbit_server_info: str):
     """Async QbitClient fixture connected to the running server.
 
     Creates a fresh QbitClient for each test, properly integrated
-    with pytest-asyncio's event loop management.
+    with pytest-asyncio's event loop management. The client is cheap;
+    the server process behind it comes from the session-scoped
+    qbit_server_info fixture and is shared by every test. Tests isolate
+    their state with create_session() and must call delete_session()
+    in a finally block.
 
     Args:
         qbit_server_info: Base URL from the server fixture
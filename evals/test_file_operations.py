@@ -8,6 +8,7 @@ Tests verify that:
 """
 
 import os
+import re
 from pathlib import Path
 
 import pytest
@@ -94,10 +95,10 @@ class TestFileCreation:
             assert test_file.exists(), "File should have been created"
             content = test_file.read_text().strip()
 
-            # Check that all lines are present
-            assert "Line 1" in content, "Should contain Line 1"
-            assert "Line 2" in content, "Should contain Line 2"
-            assert "Line 3" in content, "Should contain Line 3"
+            # Check that all lines are present (one tokenizing pass)
+            line_numbers = set(re.findall(r"Line (\d+)", content))
+            missing = {"1", "2", "3"} - line_numbers
+            assert not missing, f"Should contain Line {', Line '.join(sorted(missing))}"
 
         finally:
             await qbit_server.delete_session(session_id)
@@ -7,6 +7,7 @@ Tests verify that:
 4. Session finalization works correctly
 """
 
+import asyncio
 import re
 from pathlib import Path
 
@@ -321,14 +322,14 @@ class TestSessionIsolation:
         session_id_2 = await qbit_server.create_session()
 
         try:
-            # Execute in first session
-            await qbit_server.execute_simple(
-                session_id_1, "I am session one", timeout_secs=60
-            )
-
-            # Execute in second session
-            await qbit_server.execute_simple(
-                session_id_2, "I am session two", timeout_secs=60
+            # The sessions are independent, so run both prompts at once
+            await asyncio.gather(
+                qbit_server.execute_simple(
+                    session_id_1, "I am session one", timeout_secs=60
+                ),
+                qbit_server.execute_simple(
+                    session_id_2, "I am session two", timeout_secs=60
+                ),
             )
 
             new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
@@ -7,15 +7,56 @@ Tests verify that:
 4. Session lifecycle works (create -> use -> complete)
 """
 
+import contextlib
+import itertools
 import os
 import re
+import tomllib
 from pathlib import Path
+from typing import Iterator
 
 import pytest
+import pytest_asyncio
 import yaml
 
 from client import QbitClient, StreamingRunner
 
+# Files and directories every sidecar session directory must contain
+EXPECTED_STRUCTURE = frozenset({
+    "state.md",
+    "log.md",
+    "patches/staged",
+    "patches/applied",
+    "artifacts/pending",
+    "artifacts/applied",
+})
+
+# Keys every state.md frontmatter must carry (metadata plus context fields)
+REQUIRED_STATE_FIELDS = frozenset({
+    "session_id",
+    "created_at",
+    "updated_at",
+    "status",
+    "cwd",
+    "initial_request",
+})
+
+# Keys every patch .meta.toml must carry
+REQUIRED_PATCH_META_FIELDS = frozenset({"id", "created_at", "boundary_reason"})
+
+# Scratch files go into a QBIT_WORKSPACE that every xdist worker shares, so
+# their names carry the worker id plus a per-process counter
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+_scratch_counter = itertools.count()
+
+# Matches "**Tool**", "**File..." or "**User**" log entries in a single pass
+_LOG_ENTRY_RE = re.compile(rb"\*\*(?:Tool\*\*|File|User\*\*)")
+
+
+def _scratch_filename(stem: str) -> str:
+    """Return a workspace filename unique to this worker and call."""
+    return f"{stem}_{_WORKER_ID}_{next(_scratch_counter)}.txt"
+
 
 def parse_state_frontmatter(session_dir: Path) -> dict:
     """Parse YAML frontmatter from state.md file."""
@@ -39,176 +80,245 @@ def parse_state_frontmatter(session_dir: Path) -> dict:
     except yaml.YAMLError:
         return {}
 
+
+def load_patch_meta(meta_path: Path) -> dict:
+    """Load a patch .meta.toml file."""
+    with open(meta_path, "rb") as f:
+        return tomllib.load(f)
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-def find_recent_session_dirs(sessions_dir: Path, prefix: str = "") -> list[Path]:
-    """Find session directories (not JSON files) in the sessions dir."""
-    if not sessions_dir.exists():
-        return []
+def _scan_session_inodes(sessions_dir: Path) -> dict[int, tuple[Path, float]]:
+    """Snapshot session directories keyed by inode.
 
-    dirs = []
-    for item in sessions_dir.iterdir():
-        if item.is_dir() and (not prefix or item.name.startswith(prefix)):
-            # Check if it has the expected sidecar files (state.md is the main session file)
-            if (item / "state.md").exists():
-                dirs.append(item)
+    Diffing two snapshots by inode avoids hashing and normalizing Path objects;
+    ``DirEntry.inode()`` comes from the directory listing without an extra stat.
+    """
+    if not sessions_dir.exists():
+        return {}
 
-    # Sort by modification time, newest first
-    dirs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    dirs = {}
+    with os.scandir(sessions_dir) as it:
+        for entry in it:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "state.md")):
+                dirs[entry.inode()] = (Path(entry.path), entry.stat().st_mtime)
     return dirs
 
 
-# =============================================================================
-# Session Structure Tests
-# =============================================================================
-
-
-class TestSidecarSessionStructure:
-    """Tests for sidecar session file structure."""
-
-    @pytest.mark.asyncio
-    async def test_session_creates_directory_structure(self, qbit_server, eval_sessions_dir):
-        """Verify that running a prompt creates proper session directory."""
-        sessions_dir = Path(eval_sessions_dir)
-
-        # Get existing session dirs before test
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+async def _new_session_dirs(
+    client: QbitClient,
+    session_id: str,
+    sessions_dir: Path,
+    before: dict[int, tuple[Path, float]],
+) -> list[Path]:
+    """Flush the session's sidecar and return directories created since ``before``.
+
+    Directories are ordered newest first. Fails the test if none were created.
+    """
+    await client.flush_sidecar(session_id)
+    current = _scan_session_inodes(sessions_dir)
+    created = sorted(
+        (current[ino] for ino in current.keys() - before.keys()),
+        key=lambda d: d[1],
+        reverse=True,
+    )
+    assert created, "No session directory created"
+    return [path for path, _ in created]
+
+
+async def _new_session_dir(
+    client: QbitClient,
+    session_id: str,
+    sessions_dir: Path,
+    before: dict[int, tuple[Path, float]],
+) -> Path:
+    """Flush the session's sidecar and return the newest directory created since ``before``."""
+    return (await _new_session_dirs(client, session_id, sessions_dir, before))[0]
+
+
+def _collect_tree(root: Path, max_depth: int = 2) -> set[str]:
+    """Collect relative POSIX paths under ``root`` down to ``max_depth`` levels."""
+    paths: set[str] = set()
+    stack = [(str(root), "", 1)]
+    while stack:
+        dir_path, rel_prefix, depth = stack.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel = f"{rel_prefix}{entry.name}"
+                paths.add(rel)
+                if depth < max_depth and entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{rel}/", depth + 1))
+    return paths
+
+
+def _listdir_suffix(directory: Path, suffix: str) -> Iterator[Path]:
+    """Lazily yield files in ``directory`` whose names end with ``suffix``.
+
+    Yields nothing if the directory does not exist.
+    """
+    try:
+        it = os.scandir(directory)
+    except FileNotFoundError:
+        return
+    with it:
+        for entry in it:
+            if entry.name.endswith(suffix):
+                yield Path(entry.path)
+
+
+@contextlib.contextmanager
+def _session_dir_fd(session_dir: Path) -> Iterator[int]:
+    """Open a session directory once so probes inside it resolve relative to the fd."""
+    dfd = os.open(session_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        yield dfd
+    finally:
+        os.close(dfd)
 
-        # Create session and run a prompt
-        session_id = await qbit_server.create_session()
-        try:
-            # Execute a simple prompt to trigger sidecar activity
-            response = await qbit_server.execute_simple(
-                session_id, "Say 'hello' and nothing else.", timeout_secs=60
-            )
-            assert response  # Got some response
 
-            # Find new session directories
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
+def _exists_at(dfd: int, rel_path: str) -> bool:
+    """Check whether ``rel_path`` exists relative to an open directory fd."""
+    try:
+        os.stat(rel_path, dir_fd=dfd)
+    except FileNotFoundError:
+        return False
+    return True
 
-            # Skip if no session directory created (sidecar may be disabled)
-            if len(new_dirs) == 0:
-                pytest.skip("No session directory created - sidecar may be disabled")
 
-            # Check the newest session directory
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+def _read_text_at(dfd: int, rel_path: str) -> str:
+    """Read a text file relative to an open directory fd."""
+    fd = os.open(rel_path, os.O_RDONLY, dir_fd=dfd)
+    with os.fdopen(fd, encoding="utf-8") as f:
+        return f.read()
 
-            # Verify expected files exist (state.md contains metadata as YAML frontmatter)
-            assert (session_dir / "state.md").exists(), "state.md not found"
-            assert (session_dir / "log.md").exists(), "log.md not found"
 
-        finally:
-            await qbit_server.delete_session(session_id)
+@pytest_asyncio.fixture(scope="module", loop_scope="module", autouse=True)
+async def _require_sidecar(qbit_server_info, eval_sessions_dir):
+    """Probe once whether the server creates sidecar session directories.
 
-    @pytest.mark.asyncio
-    async def test_state_md_metadata(self, qbit_server, eval_sessions_dir):
-        """Verify state.md has required metadata in YAML frontmatter."""
-        sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+    Skips the whole module when the sidecar is disabled, so individual tests
+    can treat a missing session directory as a failure instead of a skip.
+    """
+    sessions_dir = Path(eval_sessions_dir)
+    before = _scan_session_inodes(sessions_dir)
 
-        session_id = await qbit_server.create_session()
+    async with QbitClient(qbit_server_info) as client:
+        session_id = await client.create_session()
         try:
-            await qbit_server.execute_simple(
-                session_id, "What is 2+2?", timeout_secs=60
+            await client.execute_simple(
+                session_id, "Say 'ok' and nothing else.", timeout_secs=60
             )
-
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
-
-            # Parse YAML frontmatter from state.md
-            meta = parse_state_frontmatter(session_dir)
-
-            # Check required fields
-            assert "session_id" in meta, "session_id missing from state.md frontmatter"
-            assert "created_at" in meta, "created_at missing from state.md frontmatter"
-            assert "updated_at" in meta, "updated_at missing from state.md frontmatter"
-            assert "status" in meta, "status missing from state.md frontmatter"
-
-            # Check context fields
-            assert "cwd" in meta, "cwd missing from state.md frontmatter"
-            assert "initial_request" in meta, "initial_request missing from state.md"
-
-            # Status should be active or completed (case-insensitive)
-            status = meta["status"]
-            if isinstance(status, str):
-                assert status.lower() in ("active", "completed"), (
-                    f"Invalid status: {status}"
-                )
-
+            await client.flush_sidecar(session_id)
         finally:
-            await qbit_server.delete_session(session_id)
+            await client.delete_session(session_id)
 
-    @pytest.mark.asyncio
-    async def test_state_md_structure(self, qbit_server, eval_sessions_dir):
-        """Verify state.md has expected structure."""
-        sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+    if not _scan_session_inodes(sessions_dir).keys() - before.keys():
+        pytest.skip("No session directory created - sidecar may be disabled")
 
-        session_id = await qbit_server.create_session()
-        try:
-            await qbit_server.execute_simple(
-                session_id, "List files in the current directory.", timeout_secs=60
-            )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
-            state_path = session_dir / "state.md"
+# =============================================================================
+# Session Structure Tests
+# =============================================================================
 
-            state_content = state_path.read_text()
 
-            # Should have markdown headers
-            assert "# Session State" in state_content or "# " in state_content, (
-                "state.md should have markdown headers"
-            )
+@pytest.fixture(scope="class")
+async def seeded_session_dir(class_qbit_server, eval_sessions_dir):
+    """Shared fixture: sidecar directory for one session with a tool call.
 
-            # Should contain session info
-            assert len(state_content) > 50, "state.md seems too short"
+    One LLM call shared by the read-only checks in TestSidecarSessionStructure.
+    The session stays alive until the class finishes.
+    """
+    sessions_dir = Path(eval_sessions_dir)
+    existing_dirs = _scan_session_inodes(sessions_dir)
 
-        finally:
-            await qbit_server.delete_session(session_id)
+    session_id = await class_qbit_server.create_session()
+    try:
+        response = await class_qbit_server.execute_simple(
+            session_id, "List files in the current directory.", timeout_secs=60
+        )
+        assert response  # Got some response
+
+        yield await _new_session_dir(
+            class_qbit_server, session_id, sessions_dir, existing_dirs
+        )
+    finally:
+        await class_qbit_server.delete_session(session_id)
+
+
+@pytest.fixture(scope="class")
+def seeded_session_files(seeded_session_dir) -> dict[str, str]:
+    """Shared fixture: state.md and log.md of the seeded session, read once.
+
+    The read-only structure checks inspect this in-memory snapshot instead of
+    going back to disk for every assertion.
+    """
+    with _session_dir_fd(seeded_session_dir) as dfd:
+        return {
+            name: _read_text_at(dfd, name)
+            for name in ("state.md", "log.md")
+            if _exists_at(dfd, name)
+        }
+
+
+@pytest.mark.xdist_group(name="sidecar-structure")
+class TestSidecarSessionStructure:
+    """Tests for sidecar session file structure."""
 
     @pytest.mark.asyncio
-    async def test_log_md_has_entries(self, qbit_server, eval_sessions_dir):
-        """Verify log.md captures events."""
-        sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+    async def test_session_creates_directory_structure(self, seeded_session_files: dict[str, str]):
+        """Verify that running a prompt creates proper session directory."""
+        # Verify expected files exist (state.md contains metadata as YAML frontmatter)
+        assert "state.md" in seeded_session_files, "state.md not found"
+        assert "log.md" in seeded_session_files, "log.md not found"
 
-        session_id = await qbit_server.create_session()
-        try:
-            await qbit_server.execute_simple(
-                session_id, "Echo back: test message", timeout_secs=60
+    @pytest.mark.asyncio
+    async def test_state_md_metadata(self, seeded_session_dir: Path):
+        """Verify state.md has required metadata in YAML frontmatter."""
+        # Parse YAML frontmatter from state.md
+        meta = parse_state_frontmatter(seeded_session_dir)
+
+        # Check required metadata and context fields
+        missing = REQUIRED_STATE_FIELDS - meta.keys()
+        assert not missing, f"Missing from state.md frontmatter: {sorted(missing)}"
+
+        # Status should be active or completed (case-insensitive)
+        status = meta["status"]
+        if isinstance(status, str):
+            assert status.lower() in ("active", "completed"), (
+                f"Invalid status: {status}"
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
+    @pytest.mark.asyncio
+    async def test_state_md_structure(self, seeded_session_files: dict[str, str]):
+        """Verify state.md has expected structure."""
+        state_content = seeded_session_files["state.md"]
 
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
-            log_path = session_dir / "log.md"
+        # Should have markdown headers
+        assert "# Session State" in state_content or "# " in state_content, (
+            "state.md should have markdown headers"
+        )
 
-            log_content = log_path.read_text()
+        # Should contain session info
+        assert len(state_content) > 50, "state.md seems too short"
 
-            # Log should have session start marker
-            assert "Session" in log_content and "started" in log_content.lower(), (
-                "log.md should have session start entry"
-            )
+    @pytest.mark.asyncio
+    async def test_log_md_has_entries(self, seeded_session_files: dict[str, str]):
+        """Verify log.md captures events."""
+        log_content = seeded_session_files["log.md"]
 
-            # Log should have a timestamp (YYYY-MM-DD format)
-            assert re.search(r"\d{4}-\d{2}-\d{2}", log_content), (
-                f"log.md should have timestamps, got: {log_content[:200]}"
-            )
+        # Log should have session start marker
+        assert "Session" in log_content and "started" in log_content.lower(), (
+            "log.md should have session start entry"
+        )
 
-        finally:
-            await qbit_server.delete_session(session_id)
+        # Log should have a timestamp (YYYY-MM-DD format)
+        assert re.search(r"\d{4}-\d{2}-\d{2}", log_content), (
+            f"log.md should have timestamps, got: {log_content[:200]}"
+        )
 
 
 # =============================================================================
@@ -216,6 +326,7 @@ class TestSidecarSessionStructure:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-lifecycle")
 class TestSidecarSessionLifecycle:
     """Tests for session lifecycle management."""
 
@@ -223,7 +334,7 @@ class TestSidecarSessionLifecycle:
     async def test_multiple_prompts_same_session(self, qbit_server, eval_sessions_dir):
         """Verify multiple prompts use the same session directory."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -235,16 +346,16 @@ class TestSidecarSessionLifecycle:
                 session_id, "Say 'second'", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
+            new_dirs = await _new_session_dirs(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
 
             # Should still only have ONE session directory (not two)
             assert len(new_dirs) == 1, (
                 f"Expected 1 session directory for 2 prompts, got {len(new_dirs)}"
             )
 
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = new_dirs[0]
             log_path = session_dir / "log.md"
 
             # Log file should exist
@@ -257,7 +368,7 @@ class TestSidecarSessionLifecycle:
     async def test_events_jsonl_created(self, qbit_server, eval_sessions_dir):
         """Verify events.jsonl is created for raw event storage (if enabled)."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -265,11 +376,9 @@ class TestSidecarSessionLifecycle:
                 session_id, "What time is it?", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             events_path = session_dir / "events.jsonl"
 
             # events.jsonl may or may not exist depending on implementation
@@ -286,6 +395,7 @@ class TestSidecarSessionLifecycle:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-content")
 class TestSidecarContentCapture:
     """Tests for verifying sidecar captures correct content."""
 
@@ -293,7 +403,7 @@ class TestSidecarContentCapture:
     async def test_initial_request_captured(self, qbit_server, eval_sessions_dir):
         """Verify initial request is captured in state.md frontmatter."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         test_prompt = "Calculate the factorial of 5"
 
@@ -301,11 +411,9 @@ class TestSidecarContentCapture:
         try:
             await qbit_server.execute_simple(session_id, test_prompt, timeout_secs=60)
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             meta = parse_state_frontmatter(session_dir)
 
             # Initial request should be captured
@@ -321,17 +429,15 @@ class TestSidecarContentCapture:
     async def test_working_directory_captured(self, qbit_server, eval_sessions_dir):
         """Verify working directory is captured."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
             await qbit_server.execute_simple(session_id, "pwd", timeout_secs=60)
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             meta = parse_state_frontmatter(session_dir)
 
             cwd = meta.get("cwd", "")
@@ -349,6 +455,7 @@ class TestSidecarContentCapture:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-updates")
 class TestSidecarDynamicUpdates:
     """Tests verifying sidecar updates state.md and log.md during event processing."""
 
@@ -356,7 +463,7 @@ class TestSidecarDynamicUpdates:
     async def test_state_updated_at_changes_after_tool_use(self, qbit_server, eval_sessions_dir):
         """Verify state.md updated_at timestamp changes after tool execution."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -365,11 +472,9 @@ class TestSidecarDynamicUpdates:
                 session_id, "Read the contents of pyproject.toml", timeout_secs=90
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             meta = parse_state_frontmatter(session_dir)
 
             created_at = meta.get("created_at")
@@ -389,7 +494,7 @@ class TestSidecarDynamicUpdates:
     async def test_log_captures_tool_calls(self, qbit_server, eval_sessions_dir):
         """Verify log.md captures tool call events."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -398,24 +503,17 @@ class TestSidecarDynamicUpdates:
                 session_id, "List the files in the current directory", timeout_secs=90
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             log_path = session_dir / "log.md"
 
             assert log_path.exists(), "log.md should exist"
-            log_content = log_path.read_text()
+            log_bytes = log_path.read_bytes()
 
             # Log should have tool entries (either "Tool" or file operation entries)
-            has_tool_entry = (
-                "**Tool**" in log_content
-                or "**File" in log_content
-                or "**User**" in log_content
-            )
-            assert has_tool_entry, (
-                f"log.md should contain tool/file/user entries. Content:\n{log_content[:500]}"
+            assert _LOG_ENTRY_RE.search(log_bytes), (
+                f"log.md should contain tool/file/user entries. Content:\n{log_bytes[:500]!r}"
             )
 
         finally:
@@ -425,7 +523,7 @@ class TestSidecarDynamicUpdates:
     async def test_log_captures_user_prompts(self, qbit_server, eval_sessions_dir):
         """Verify log.md captures user prompt events."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -437,21 +535,19 @@ class TestSidecarDynamicUpdates:
                 session_id, "Say goodbye", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             log_path = session_dir / "log.md"
 
             assert log_path.exists(), "log.md should exist"
-            log_content = log_path.read_text()
+            log_bytes = log_path.read_bytes()
 
             # Count user entries - should have at least 1 (second prompt gets logged)
-            user_entries = log_content.count("**User**")
+            user_entries = log_bytes.count(b"**User**")
             # Note: First prompt may not be logged as user event if captured differently
-            assert user_entries >= 0 or "Session started" in log_content, (
-                f"log.md should have session content. Got: {log_content[:500]}"
+            assert user_entries >= 1 or b"Session started" in log_bytes, (
+                f"log.md should have session content. Got: {log_bytes[:500]!r}"
             )
 
         finally:
@@ -463,6 +559,7 @@ class TestSidecarDynamicUpdates:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-edge-cases")
 class TestSidecarEdgeCases:
     """Edge case tests for sidecar system."""
 
@@ -483,7 +580,7 @@ class TestSidecarEdgeCases:
     async def test_state_backup_created(self, qbit_server, eval_sessions_dir):
         """Verify state.md.bak is created after state updates."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -495,18 +592,16 @@ class TestSidecarEdgeCases:
                 session_id, "How are you?", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
-            backup_path = session_dir / "state.md.bak"
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
 
             # Backup may or may not exist depending on whether state was updated
             # Just verify the check doesn't crash
-            if backup_path.exists():
-                backup_content = backup_path.read_text()
-                assert len(backup_content) > 0, "Backup should have content"
+            with _session_dir_fd(session_dir) as dfd:
+                if _exists_at(dfd, "state.md.bak"):
+                    backup_content = _read_text_at(dfd, "state.md.bak")
+                    assert len(backup_content) > 0, "Backup should have content"
 
         finally:
             await qbit_server.delete_session(session_id)
@@ -517,6 +612,7 @@ class TestSidecarEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-patches")
 class TestSidecarPatches:
     """Tests for patch file generation (L2 layer)."""
 
@@ -524,7 +620,7 @@ class TestSidecarPatches:
     async def test_patches_directory_structure_created(self, qbit_server, eval_sessions_dir):
         """Verify patches directory structure is created with session."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -532,22 +628,17 @@ class TestSidecarPatches:
                 session_id, "Say hello", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
-            patches_dir = session_dir / "patches"
-
-            # Patches directory should exist
-            assert patches_dir.exists(), "patches/ directory should exist"
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
 
-            # Should have staged and applied subdirectories
-            staged_dir = patches_dir / "staged"
-            applied_dir = patches_dir / "applied"
+            with _session_dir_fd(session_dir) as dfd:
+                # Patches directory should exist
+                assert _exists_at(dfd, "patches"), "patches/ directory should exist"
 
-            assert staged_dir.exists(), "patches/staged/ should exist"
-            assert applied_dir.exists(), "patches/applied/ should exist"
+                # Should have staged and applied subdirectories
+                assert _exists_at(dfd, "patches/staged"), "patches/staged/ should exist"
+                assert _exists_at(dfd, "patches/applied"), "patches/applied/ should exist"
 
         finally:
             await qbit_server.delete_session(session_id)
@@ -560,10 +651,10 @@ class TestSidecarPatches:
         This may skip if no boundary is triggered during the test.
         """
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use workspace-relative path (file will be created inside workspace)
-        test_filename = "test_patch_creation.txt"
+        test_filename = _scratch_filename("test_patch_creation")
 
         session_id = await qbit_server.create_session()
         try:
@@ -575,26 +666,24 @@ class TestSidecarPatches:
                 timeout_secs=120
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             staged_dir = session_dir / "patches" / "staged"
 
-            # List any .patch files in staged directory
-            patch_files = list(staged_dir.glob("*.patch")) if staged_dir.exists() else []
+            # Find a .patch file in staged directory
+            patch_file = next(_listdir_suffix(staged_dir, ".patch"), None)
 
             # Patches may or may not be created depending on boundary detection
             # Just verify the structure is correct if patches exist
-            if patch_files:
+            if patch_file is not None:
                 # Verify patch file format
-                patch_content = patch_files[0].read_text()
+                patch_content = patch_file.read_text()
                 assert len(patch_content) > 0, "Patch file should have content"
 
                 # Check for meta file
-                meta_files = list(staged_dir.glob("*.meta.toml"))
-                assert len(meta_files) > 0, "Meta file should exist for patch"
+                meta_file = next(_listdir_suffix(staged_dir, ".meta.toml"), None)
+                assert meta_file is not None, "Meta file should exist for patch"
             else:
                 # No patches created - this is OK if no boundary was detected
                 # Just verify the directory structure exists
@@ -603,22 +692,17 @@ class TestSidecarPatches:
         finally:
             await qbit_server.delete_session(session_id)
             # Clean up test file in workspace
-            import os
-            workspace = os.environ.get("QBIT_WORKSPACE", ".")
-            test_file_path = os.path.join(workspace, test_filename)
-            try:
-                os.remove(test_file_path)
-            except FileNotFoundError:
-                pass
+            workspace = Path(os.environ.get("QBIT_WORKSPACE", "."))
+            (workspace / test_filename).unlink(missing_ok=True)
 
     @pytest.mark.asyncio
     async def test_patch_meta_file_format(self, qbit_server, eval_sessions_dir):
         """Verify patch meta files have correct TOML format if created."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use workspace-relative path (file will be created inside workspace)
-        test_filename = "test_meta_format.txt"
+        test_filename = _scratch_filename("test_meta_format")
 
         session_id = await qbit_server.create_session()
         try:
@@ -629,38 +713,28 @@ class TestSidecarPatches:
                 timeout_secs=120
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             staged_dir = session_dir / "patches" / "staged"
 
-            meta_files = list(staged_dir.glob("*.meta.toml")) if staged_dir.exists() else []
+            meta_file = next(_listdir_suffix(staged_dir, ".meta.toml"), None)
 
-            if meta_files:
-                import tomllib
-                meta_content = meta_files[0].read_text()
+            if meta_file is not None:
                 # Should be valid TOML
-                meta_data = tomllib.loads(meta_content)
+                meta_data = load_patch_meta(meta_file)
 
                 # Should have required fields
-                assert "id" in meta_data, "Meta should have id field"
-                assert "created_at" in meta_data, "Meta should have created_at field"
-                assert "boundary_reason" in meta_data, "Meta should have boundary_reason field"
+                missing = REQUIRED_PATCH_META_FIELDS - meta_data.keys()
+                assert not missing, f"Meta missing fields: {sorted(missing)}"
             else:
                 pytest.skip("No patches created - boundary not triggered")
 
         finally:
             await qbit_server.delete_session(session_id)
             # Clean up test file in workspace
-            import os
-            workspace = os.environ.get("QBIT_WORKSPACE", ".")
-            test_file_path = os.path.join(workspace, test_filename)
-            try:
-                os.remove(test_file_path)
-            except FileNotFoundError:
-                pass
+            workspace = Path(os.environ.get("QBIT_WORKSPACE", "."))
+            (workspace / test_filename).unlink(missing_ok=True)
 
 
 # =============================================================================
@@ -668,6 +742,7 @@ class TestSidecarPatches:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-state-content")
 class TestSidecarStateContent:
     """Tests for verifying state.md content format and updates."""
 
@@ -675,10 +750,10 @@ class TestSidecarStateContent:
     async def test_state_has_goals_section(self, qbit_server, eval_sessions_dir):
         """Verify state.md has a Goals section with user's goal."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use workspace-relative path (file will be created inside workspace)
-        test_filename = "test_goals_section.txt"
+        test_filename = _scratch_filename("test_goals_section")
 
         session_id = await qbit_server.create_session()
         try:
@@ -689,11 +764,9 @@ class TestSidecarStateContent:
                 timeout_secs=120
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             state_path = session_dir / "state.md"
             state_content = state_path.read_text()
 
@@ -705,22 +778,17 @@ class TestSidecarStateContent:
         finally:
             await qbit_server.delete_session(session_id)
             # Clean up test file in workspace
-            import os
-            workspace = os.environ.get("QBIT_WORKSPACE", ".")
-            test_file_path = os.path.join(workspace, test_filename)
-            try:
-                os.remove(test_file_path)
-            except FileNotFoundError:
-                pass
+            workspace = Path(os.environ.get("QBIT_WORKSPACE", "."))
+            (workspace / test_filename).unlink(missing_ok=True)
 
     @pytest.mark.asyncio
     async def test_state_has_changes_section(self, qbit_server, eval_sessions_dir):
         """Verify state.md has a Changes section after file modification."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use workspace-relative path (file will be created inside workspace)
-        test_filename = "test_changes_section.txt"
+        test_filename = _scratch_filename("test_changes_section")
 
         session_id = await qbit_server.create_session()
         try:
@@ -731,11 +799,9 @@ class TestSidecarStateContent:
                 timeout_secs=120
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             state_path = session_dir / "state.md"
             state_content = state_path.read_text()
 
@@ -747,22 +813,17 @@ class TestSidecarStateContent:
         finally:
             await qbit_server.delete_session(session_id)
             # Clean up test file in workspace
-            import os
-            workspace = os.environ.get("QBIT_WORKSPACE", ".")
-            test_file_path = os.path.join(workspace, test_filename)
-            try:
-                os.remove(test_file_path)
-            except FileNotFoundError:
-                pass
+            workspace = Path(os.environ.get("QBIT_WORKSPACE", "."))
+            (workspace / test_filename).unlink(missing_ok=True)
 
     @pytest.mark.asyncio
     async def test_state_changes_include_file_path(self, qbit_server, eval_sessions_dir):
         """Verify Changes section includes the modified file path."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use workspace-relative path (file will be created inside workspace)
-        test_filename = "test_filepath_changes.txt"
+        test_filename = _scratch_filename("test_filepath_changes")
 
         session_id = await qbit_server.create_session()
         try:
@@ -772,11 +833,9 @@ class TestSidecarStateContent:
                 timeout_secs=120
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             state_path = session_dir / "state.md"
             state_content = state_path.read_text()
 
@@ -793,19 +852,14 @@ class TestSidecarStateContent:
         finally:
             await qbit_server.delete_session(session_id)
             # Clean up test file in workspace
-            import os
-            workspace = os.environ.get("QBIT_WORKSPACE", ".")
-            test_file_path = os.path.join(workspace, test_filename)
-            try:
-                os.remove(test_file_path)
-            except FileNotFoundError:
-                pass
+            workspace = Path(os.environ.get("QBIT_WORKSPACE", "."))
+            (workspace / test_filename).unlink(missing_ok=True)
 
     @pytest.mark.asyncio
     async def test_state_has_session_state_header(self, qbit_server, eval_sessions_dir):
         """Verify state.md has the expected header structure."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -813,11 +867,9 @@ class TestSidecarStateContent:
                 session_id, "Say hello", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             state_path = session_dir / "state.md"
             state_content = state_path.read_text()
 
@@ -843,7 +895,7 @@ class TestSidecarStateContent:
     async def test_state_goal_reflects_user_intent(self, qbit_server, eval_sessions_dir):
         """Verify Goals section captures the user's actual intent."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use a distinctive goal that should be captured
         test_goal = "Calculate the sum of 123 and 456"
@@ -854,11 +906,9 @@ class TestSidecarStateContent:
                 session_id, test_goal, timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             state_path = session_dir / "state.md"
             state_content = state_path.read_text()
 
@@ -885,10 +935,10 @@ class TestSidecarStateContent:
     async def test_state_updated_after_file_edit(self, qbit_server, eval_sessions_dir):
         """Verify state.md is updated when files are edited."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         # Use workspace-relative path (file will be created inside workspace)
-        test_filename = "test_edit_changes.txt"
+        test_filename = _scratch_filename("test_edit_changes")
 
         session_id = await qbit_server.create_session()
         try:
@@ -899,11 +949,9 @@ class TestSidecarStateContent:
                 timeout_secs=120
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
             state_path = session_dir / "state.md"
 
             # Get initial state
@@ -918,6 +966,7 @@ class TestSidecarStateContent:
             )
 
             # Check if state was updated
+            await qbit_server.flush_sidecar(session_id)
             final_content = state_path.read_text()
 
             # Either mtime changed or content changed
@@ -934,13 +983,8 @@ class TestSidecarStateContent:
         finally:
             await qbit_server.delete_session(session_id)
             # Clean up test file in workspace
-            import os
-            workspace = os.environ.get("QBIT_WORKSPACE", ".")
-            test_file_path = os.path.join(workspace, test_filename)
-            try:
-                os.remove(test_file_path)
-            except FileNotFoundError:
-                pass
+            workspace = Path(os.environ.get("QBIT_WORKSPACE", "."))
+            (workspace / test_filename).unlink(missing_ok=True)
 
 
 # =============================================================================
@@ -948,6 +992,7 @@ class TestSidecarStateContent:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="sidecar-artifacts")
 class TestSidecarArtifacts:
     """Tests for artifact file generation (L3 layer - README.md, CLAUDE.md)."""
 
@@ -955,7 +1000,7 @@ class TestSidecarArtifacts:
     async def test_artifacts_directory_structure_created(self, qbit_server, eval_sessions_dir):
         """Verify artifacts directory structure is created with session."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -963,22 +1008,17 @@ class TestSidecarArtifacts:
                 session_id, "What is 2+2?", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
-            artifacts_dir = session_dir / "artifacts"
-
-            # Artifacts directory should exist
-            assert artifacts_dir.exists(), "artifacts/ directory should exist"
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
 
-            # Should have pending and applied subdirectories
-            pending_dir = artifacts_dir / "pending"
-            applied_dir = artifacts_dir / "applied"
+            with _session_dir_fd(session_dir) as dfd:
+                # Artifacts directory should exist
+                assert _exists_at(dfd, "artifacts"), "artifacts/ directory should exist"
 
-            assert pending_dir.exists(), "artifacts/pending/ should exist"
-            assert applied_dir.exists(), "artifacts/applied/ should exist"
+                # Should have pending and applied subdirectories
+                assert _exists_at(dfd, "artifacts/pending"), "artifacts/pending/ should exist"
+                assert _exists_at(dfd, "artifacts/applied"), "artifacts/applied/ should exist"
 
         finally:
             await qbit_server.delete_session(session_id)
@@ -987,7 +1027,7 @@ class TestSidecarArtifacts:
     async def test_session_directory_complete_structure(self, qbit_server, eval_sessions_dir):
         """Verify complete session directory structure is created."""
         sessions_dir = Path(eval_sessions_dir)
-        existing_dirs = set(find_recent_session_dirs(sessions_dir))
+        existing_dirs = _scan_session_inodes(sessions_dir)
 
         session_id = await qbit_server.create_session()
         try:
@@ -995,25 +1035,13 @@ class TestSidecarArtifacts:
                 session_id, "Hello!", timeout_secs=60
             )
 
-            new_dirs = set(find_recent_session_dirs(sessions_dir)) - existing_dirs
-            if not new_dirs:
-                pytest.skip("No session directory created - sidecar may be disabled")
-
-            session_dir = max(new_dirs, key=lambda p: p.stat().st_mtime)
+            session_dir = await _new_session_dir(
+                qbit_server, session_id, sessions_dir, existing_dirs
+            )
 
             # Verify complete directory structure
-            expected_structure = [
-                "state.md",
-                "log.md",
-                "patches/staged",
-                "patches/applied",
-                "artifacts/pending",
-                "artifacts/applied",
-            ]
-
-            for path in expected_structure:
-                full_path = session_dir / path
-                assert full_path.exists(), f"{path} should exist in session directory"
+            missing = EXPECTED_STRUCTURE - _collect_tree(session_dir)
+            assert not missing, f"{sorted(missing)} should exist in session directory"
 
         finally:
             await qbit_server.delete_session(session_id)
@@ -4,7 +4,11 @@ This module uses the existing eval client infrastructure and reads server logs
 after execution to diagnose the patch generation flow.
 
 Run:
-    RUST_LOG=debug RUN_API_TESTS=1 pytest test_sidecar_sse_diagnostics.py -v -s
+    RUST_LOG=debug RUN_API_TESTS=1 pytest test_sidecar_sse_diagnostics.py -v \
+        -o log_cli=true --log-cli-level=DEBUG
+
+Diagnostic output goes through this module's logger rather than print, so
+passing runs stay quiet and pytest attaches it to the report of failing tests.
 
 The tests check each stage of the event flow:
 1. Event capture (CaptureContext)
@@ -13,32 +17,58 @@ The tests check each stage of the event flow:
 4. Patch generation (on session end)
 """
 
+import logging
 import os
 import re
+import shutil
 import subprocess
 import tempfile
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
-import httpx
 import pytest
+import pytest_asyncio
 
 from client import QbitClient, StreamingRunner
 from config import get_binary_path
-from conftest import get_eval_sessions_dir
+from conftest import get_eval_sessions_dir, wait_for_server_health
+
+log = logging.getLogger(__name__)
+
+# Patterns for pulling values out of sidecar log lines in the handlers below
+_PAT_FILES_EXTRACTED = re.compile(r"Extracted (\d+) files.*?: \[(.*?)\]")
+_PAT_FILES_MODIFIED = re.compile(r"files_modified: (\d+)")
+_PAT_TRACKER_COUNT = re.compile(r"has (\d+) file")
+_PAT_GEN_PATCHES = re.compile(r"generate_patches=(\w+)")
+_PAT_FILE_TRACKER_END = re.compile(r"file_tracker has (\d+) file")
+_PAT_PATCH_ID = re.compile(r"Patch (\d+) created")
+
+
+# Caps on the log samples kept by SidecarDiagnostics; totals are counted separately
+_MAX_FILES_EXTRACTED = 16
+_MAX_EXTRACTION_FAILURES = 8
+_MAX_TRACKER_COUNTS = 64
+_MAX_ERRORS = 32
 
 
 @dataclass
 class SidecarDiagnostics:
-    """Collected diagnostics from sidecar log analysis."""
+    """Collected diagnostics from sidecar log analysis.
+
+    List fields keep a bounded sample of what summary() shows, so memory stays
+    flat on long debug logs; the matching *_count fields hold the totals.
+    """
 
     # Capture stage
     tool_requests_captured: int = 0
     tool_results_captured: int = 0
     files_extracted: list[str] = field(default_factory=list)
+    files_extracted_count: int = 0
     files_extraction_failures: list[str] = field(default_factory=list)
+    files_extraction_failures_count: int = 0
 
     # State forwarding stage
     events_forwarded: int = 0
@@ -49,7 +79,10 @@ class SidecarDiagnostics:
     file_edits_tracked: int = 0
     tool_calls_tracked: int = 0
     tool_calls_empty_files: int = 0
-    file_tracker_counts: list[int] = field(default_factory=list)
+    file_tracker_counts: deque[int] = field(
+        default_factory=lambda: deque(maxlen=_MAX_TRACKER_COUNTS)
+    )
+    file_tracker_peak: int = 0
 
     # Session end stage
     end_session_received: bool = False
@@ -61,6 +94,7 @@ class SidecarDiagnostics:
 
     # Errors
     errors: list[str] = field(default_factory=list)
+    errors_count: int = 0
 
     def summary(self) -> str:
         """Generate a diagnostic summary."""
@@ -72,17 +106,17 @@ class SidecarDiagnostics:
             "1. CAPTURE STAGE (CaptureContext)",
             f"   Tool requests captured: {self.tool_requests_captured}",
             f"   Tool results captured: {self.tool_results_captured}",
-            f"   Files extracted: {len(self.files_extracted)}",
+            f"   Files extracted: {self.files_extracted_count}",
         ]
 
         if self.files_extracted:
             for f in self.files_extracted[:5]:
                 lines.append(f"     - {f}")
-            if len(self.files_extracted) > 5:
-                lines.append(f"     ... and {len(self.files_extracted) - 5} more")
+            if self.files_extracted_count > 5:
+                lines.append(f"     ... and {self.files_extracted_count - 5} more")
 
         if self.files_extraction_failures:
-            lines.append(f"   ⚠ Extraction failures: {len(self.files_extraction_failures)}")
+            lines.append(f"   ⚠ Extraction failures: {self.files_extraction_failures_count}")
             for f in self.files_extraction_failures[:3]:
                 lines.append(f"     - {f[:100]}...")
 
@@ -105,7 +139,7 @@ class SidecarDiagnostics:
         ])
 
         if self.file_tracker_counts:
-            lines.append(f"   File tracker progression: {' -> '.join(map(str, self.file_tracker_counts[-10:]))}")
+            lines.append(f"   File tracker progression: {' -> '.join(map(str, list(self.file_tracker_counts)[-10:]))}")
 
         lines.extend([
             "",
@@ -123,7 +157,7 @@ class SidecarDiagnostics:
         if self.errors:
             lines.extend([
                 "",
-                "ERRORS:",
+                f"ERRORS ({self.errors_count}):",
             ])
             for err in self.errors[:10]:
                 lines.append(f"   - {err}")
@@ -137,7 +171,7 @@ class SidecarDiagnostics:
         # Provide diagnosis
         if self.tool_results_captured == 0:
             lines.append("   ⚠ No tool results captured - check if tools are being executed")
-        elif len(self.files_extracted) == 0 and self.files_extraction_failures:
+        elif self.files_extracted_count == 0 and self.files_extraction_failures:
             lines.append("   ⚠ Files not being extracted from tool args")
             lines.append("     Check parameter names in vtcode-core tools")
         elif self.events_forwarded == 0:
@@ -146,7 +180,7 @@ class SidecarDiagnostics:
         elif self.processor_missing_warnings > 0:
             lines.append("   ⚠ Processor not available when events are captured")
             lines.append("     Check sidecar initialization timing")
-        elif self.file_tracker_counts and max(self.file_tracker_counts) == 0:
+        elif self.file_tracker_counts and self.file_tracker_peak == 0:
             lines.append("   ⚠ Files not being tracked in processor")
             lines.append("     Check files_modified field population")
         elif not self.end_session_received:
@@ -170,81 +204,180 @@ class SidecarDiagnostics:
         return "\n".join(lines)
 
 
-def parse_logs(log_output: str) -> SidecarDiagnostics:
-    """Parse sidecar log messages and extract diagnostics."""
-    diag = SidecarDiagnostics()
-
-    for line in log_output.split("\n"):
-        # Capture stage
-        if "[sidecar-capture] Tool request:" in line:
-            diag.tool_requests_captured += 1
-
-        if "[sidecar-capture] Tool result:" in line:
-            diag.tool_results_captured += 1
-
-        if "[sidecar-capture] Extracted" in line and "files for write tool" in line:
-            match = re.search(r"Extracted (\d+) files.*?: \[(.*?)\]", line)
-            if match:
-                count = int(match.group(1))
-                files_str = match.group(2)
-                if files_str:
-                    diag.files_extracted.extend(f.strip().strip('"') for f in files_str.split(",") if f.strip())
-
-        if "[sidecar-capture] No files extracted for write tool" in line:
-            diag.files_extraction_failures.append(line)
-
-        # State forwarding stage
-        if "[sidecar-state] Capturing event:" in line:
-            diag.events_forwarded += 1
-            match = re.search(r"files_modified: (\d+)", line)
-            if match and int(match.group(1)) > 0:
-                diag.events_with_files_modified += 1
-
-        if "[sidecar-state] No processor available" in line:
-            diag.processor_missing_warnings += 1
+# Read size for LogTail; large enough that a debug log needs few syscalls
+_TAIL_CHUNK_SIZE = 64 * 1024
 
-        # Processor stage
-        if "[processor] FileEdit event for path:" in line:
-            diag.file_edits_tracked += 1
 
-        if "[processor] ToolCall" in line and "tracking" in line and "file(s)" in line:
-            diag.tool_calls_tracked += 1
+class LogTail:
+    """Incrementally parse a growing log file into one SidecarDiagnostics.
 
-        if "[processor] ToolCall" in line and "files_modified is empty" in line:
-            diag.tool_calls_empty_files += 1
-
-        if "[processor] File tracker now has" in line:
-            match = re.search(r"has (\d+) file", line)
-            if match:
-                diag.file_tracker_counts.append(int(match.group(1)))
-
-        # Session end stage
-        if "[processor] EndSession task received" in line:
-            diag.end_session_received = True
-
-        if "[processor] Session" in line and "ending:" in line:
-            match = re.search(r"generate_patches=(\w+)", line)
-            if match:
-                diag.generate_patches_enabled = match.group(1).lower() == "true"
-            match = re.search(r"file_tracker has (\d+) file", line)
-            if match:
-                diag.files_at_session_end = int(match.group(1))
+    Each update() reads only the bytes appended since the previous call, so
+    the log is walked once in total no matter how many tests inspect it.
+    """
 
-        if "[processor] Generating patch for session" in line:
-            diag.patch_generation_attempted = True
+    def __init__(self, log_path: Path):
+        self.log_path = log_path
+        self.offset = 0
+        self.diagnostics = SidecarDiagnostics()
+
+    def update(self) -> SidecarDiagnostics:
+        """Parse newly written lines and return the accumulated diagnostics."""
+        with open(self.log_path, "rb", buffering=0) as f:
+            f.seek(self.offset)
+            _parse_log_lines(self._complete_lines(f), self.diagnostics)
+        return self.diagnostics
+
+    def _complete_lines(self, f) -> Iterator[str]:
+        """Yield complete lines from fixed-size chunks, advancing the offset."""
+        partial = b""
+        while chunk := f.read(_TAIL_CHUNK_SIZE):
+            *lines, partial = (partial + chunk).split(b"\n")
+            for raw in lines:
+                self.offset += len(raw) + 1
+                yield raw.decode("utf-8", errors="replace")
+        # A trailing partial line is still being written; the offset points at
+        # its start, so the next update reads it again once it is complete
+
+
+# -----------------------------------------------------------------------------
+# Log line handlers, grouped by the bracketed tag that prefixes each message.
+# Each group maps a message substring to a (line, diag) handler.
+# -----------------------------------------------------------------------------
+
+
+def _on_files_extracted(line: str, diag: SidecarDiagnostics) -> None:
+    if "files for write tool" not in line:
+        return
+    match = _PAT_FILES_EXTRACTED.search(line)
+    if match:
+        files_str = match.group(2)
+        if files_str:
+            files = [f.strip().strip('"') for f in files_str.split(",") if f.strip()]
+            diag.files_extracted_count += len(files)
+            room = _MAX_FILES_EXTRACTED - len(diag.files_extracted)
+            diag.files_extracted.extend(files[:room])
+
+
+def _on_extraction_failure(line: str, diag: SidecarDiagnostics) -> None:
+    diag.files_extraction_failures_count += 1
+    if len(diag.files_extraction_failures) < _MAX_EXTRACTION_FAILURES:
+        diag.files_extraction_failures.append(line.rstrip("\n"))
+
+
+def _on_event_forwarded(line: str, diag: SidecarDiagnostics) -> None:
+    diag.events_forwarded += 1
+    match = _PAT_FILES_MODIFIED.search(line)
+    if match and int(match.group(1)) > 0:
+        diag.events_with_files_modified += 1
+
+
+def _on_tool_call(line: str, diag: SidecarDiagnostics) -> None:
+    if "tracking" in line and "file(s)" in line:
+        diag.tool_calls_tracked += 1
+    if "files_modified is empty" in line:
+        diag.tool_calls_empty_files += 1
+
+
+def _on_tracker_count(line: str, diag: SidecarDiagnostics) -> None:
+    match = _PAT_TRACKER_COUNT.search(line)
+    if match:
+        count = int(match.group(1))
+        diag.file_tracker_counts.append(count)
+        diag.file_tracker_peak = max(diag.file_tracker_peak, count)
+
+
+def _on_session_ending(line: str, diag: SidecarDiagnostics) -> None:
+    if "[processor] Session" not in line:
+        return
+    match = _PAT_GEN_PATCHES.search(line)
+    if match:
+        diag.generate_patches_enabled = match.group(1).lower() == "true"
+    match = _PAT_FILE_TRACKER_END.search(line)
+    if match:
+        diag.files_at_session_end = int(match.group(1))
+
+
+def _on_patch_created(line: str, diag: SidecarDiagnostics) -> None:
+    if "[processor] Patch" not in line:
+        return
+    diag.patch_created = True
+    match = _PAT_PATCH_ID.search(line)
+    if match:
+        diag.patch_id = int(match.group(1))
+
+
+def _on_patch_attempted(line: str, diag: SidecarDiagnostics) -> None:
+    diag.patch_generation_attempted = True
+
+
+def _count(attr: str) -> Callable[[str, SidecarDiagnostics], None]:
+    def handler(line: str, diag: SidecarDiagnostics) -> None:
+        setattr(diag, attr, getattr(diag, attr) + 1)
+    return handler
+
+
+# Capture stage
+_CAPTURE_HANDLERS = {
+    "Tool request:": _count("tool_requests_captured"),
+    "Tool result:": _count("tool_results_captured"),
+    "Extracted": _on_files_extracted,
+    "No files extracted for write tool": _on_extraction_failure,
+}
+
+# State forwarding stage
+_STATE_HANDLERS = {
+    "Capturing event:": _on_event_forwarded,
+    "No processor available": _count("processor_missing_warnings"),
+}
+
+# Processor and session end stages
+_PROCESSOR_HANDLERS = {
+    "FileEdit event for path:": _count("file_edits_tracked"),
+    "ToolCall": _on_tool_call,
+    "File tracker now has": _on_tracker_count,
+    "EndSession task received": lambda line, diag: setattr(diag, "end_session_received", True),
+    "ending:": _on_session_ending,
+    "Generating patch for session": _on_patch_attempted,
+    "created successfully": _on_patch_created,
+    "generate_patch called for session": _on_patch_attempted,
+}
+
+_HANDLERS_BY_TAG = {
+    "[sidecar-capture]": _CAPTURE_HANDLERS,
+    "[sidecar-state]": _STATE_HANDLERS,
+    "[processor]": _PROCESSOR_HANDLERS,
+}
+
+# Finds the first tag we have handlers for; tracing prefixes (timestamps,
+# levels, ANSI escapes) may contain other brackets before it.
+_PAT_TAG = re.compile(r"\[(?:sidecar-capture|sidecar-state|processor)\]")
+
+
+def _parse_log_lines(
+    lines: Iterable[str], diag: Optional[SidecarDiagnostics] = None
+) -> SidecarDiagnostics:
+    """Extract diagnostics from an iterable of log lines.
+
+    Adds to ``diag`` when given, otherwise starts from an empty one.
+    """
+    if diag is None:
+        diag = SidecarDiagnostics()
 
-        if "[processor] Patch" in line and "created successfully" in line:
-            diag.patch_created = True
-            match = re.search(r"Patch (\d+) created", line)
-            if match:
-                diag.patch_id = int(match.group(1))
+    for line in lines:
+        match = _PAT_TAG.search(line)
+        if match is None:
+            continue
+        tag = match.group(0)
 
-        if "generate_patch called for session" in line:
-            diag.patch_generation_attempted = True
+        for needle, handler in _HANDLERS_BY_TAG[tag].items():
+            if needle in line:
+                handler(line, diag)
 
         # Errors
-        if "error" in line.lower() and "[processor]" in line:
-            diag.errors.append(line.strip())
+        if tag == "[processor]" and "error" in line.lower():
+            diag.errors_count += 1
+            if len(diag.errors) < _MAX_ERRORS:
+                diag.errors.append(line.strip())
 
     return diag
 
@@ -253,6 +386,32 @@ def parse_logs(log_output: str) -> SidecarDiagnostics:
 # Server with Log Capture
 # =============================================================================
 
+def _git(workspace: Path, *args: str, check: bool = False) -> None:
+    """Run a git command in the workspace, discarding its output."""
+    subprocess.run(
+        ["git", *args],
+        cwd=workspace,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=check,
+    )
+
+
+def _init_git_workspace(workspace: Path) -> None:
+    """Initialize a git repository with one commit in the workspace.
+
+    The commit also holds edit_target.txt for test_diagnose_edit_operation,
+    so that test does not have to spawn git itself.
+    """
+    _git(workspace, "init", check=True)
+    _git(workspace, "config", "user.email", "test@test.com")
+    _git(workspace, "config", "user.name", "Test")
+    (workspace / "README.md").write_text("# Test Project\n")
+    (workspace / "edit_target.txt").write_text("Line 1\nLine 2\nLine 3\n")
+    _git(workspace, "add", ".")
+    _git(workspace, "commit", "-m", "Initial commit")
+
+
 @pytest.fixture(scope="module")
 def server_with_logs(tmp_path_factory):
     """Start server with debug logging captured to a file.
@@ -268,26 +427,27 @@ def server_with_logs(tmp_path_factory):
     log_dir = tmp_path_factory.mktemp("logs")
     log_file = log_dir / "server_debug.log"
 
-    # Create workspace for file operations
+    # Template repository; each test works in its own copy (see diag_workspace)
     workspace = tmp_path_factory.mktemp("workspace")
 
-    # Initialize git in workspace
-    subprocess.run(["git", "init"], cwd=workspace, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=workspace, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=workspace, capture_output=True)
-    (workspace / "README.md").write_text("# Test Project\n")
-    subprocess.run(["git", "add", "."], cwd=workspace, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=workspace, capture_output=True)
+    # Initialize git in the background while the server binary starts up
+    executor = ThreadPoolExecutor(max_workers=1)
+    git_setup = executor.submit(_init_git_workspace, workspace)
+    executor.shutdown(wait=False)
 
     # Build environment with debug logging
     server_env = os.environ.copy()
     server_env["RUST_LOG"] = "debug"
+    # tracing-subscriber colors output even when it is not a TTY; plain text
+    # keeps the log smaller and free of escape codes around the [tags]
+    server_env["NO_COLOR"] = "1"
     server_env["QBIT_WORKSPACE"] = str(workspace)
     # Use temp directory for sessions to prevent polluting ~/.qbit/sessions
     server_env["VT_SESSION_DIR"] = get_eval_sessions_dir()
 
-    # Open log file for stderr capture
-    log_handle = open(log_file, "w")
+    # Open log file for stderr capture. The server writes to the fd directly,
+    # so the Python-side buffer only matters for anything we write ourselves.
+    log_handle = open(log_file, "wb", buffering=1 << 20)
 
     # Start server with stderr going to log file
     proc = subprocess.Popen(
@@ -310,16 +470,11 @@ def server_with_logs(tmp_path_factory):
         host, port = match.groups()
         base_url = f"http://{host}:{port}"
 
+        # Tests need the repository, so finish git setup before going further
+        git_setup.result()
+
         # Wait for server to be ready
-        for _ in range(30):
-            try:
-                resp = httpx.get(f"{base_url}/health", timeout=1.0)
-                if resp.status_code == 200:
-                    break
-            except httpx.RequestError:
-                pass
-            time.sleep(0.5)
-        else:
+        if not wait_for_server_health(base_url):
             proc.terminate()
             log_handle.close()
             pytest.fail("Server did not become ready within 15 seconds")
@@ -327,6 +482,7 @@ def server_with_logs(tmp_path_factory):
         yield {
             "base_url": base_url,
             "log_file": log_file,
+            "log_tail": LogTail(log_file),
             "workspace": workspace,
             "process": proc,
         }
@@ -341,32 +497,60 @@ def server_with_logs(tmp_path_factory):
         log_handle.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def diag_client(server_with_logs):
-    """Async client connected to the diagnostic server."""
+    """Async client connected to the diagnostic server.
+
+    Module-scoped to match server_with_logs, so every diagnostic test reuses
+    one client. Tests using it must run on the module event loop.
+    """
     async with QbitClient(server_with_logs["base_url"]) as client:
         yield client, server_with_logs
 
 
+@pytest.fixture
+def diag_workspace(server_with_logs, tmp_path) -> Path:
+    """Per-test copy of the template git repository.
+
+    Each test gets a repository root of its own, so the sidecar's git status
+    and diffs see only that test's changes, with paths relative to the
+    session cwd. Copying the committed template skips a per-test git init.
+    """
+    workspace = tmp_path / "workspace"
+    shutil.copytree(server_with_logs["workspace"], workspace, symlinks=True)
+    return workspace
+
+
+@pytest.fixture(autouse=True)
+def diag_debug_logs(caplog):
+    """Capture this module's debug output for the report of failing tests."""
+    caplog.set_level(logging.DEBUG, logger=__name__)
+
+
 # =============================================================================
 # Diagnostic Tests
 # =============================================================================
 
+@pytest.mark.xdist_group(name="sidecar-diagnostics")
 class TestSidecarSSEDiagnostics:
-    """Diagnostic tests for sidecar patch generation using SSE server."""
+    """Diagnostic tests for sidecar patch generation using SSE server.
 
-    @pytest.mark.asyncio
+    Grouped onto one xdist worker so the module's debug server, workspace and
+    log tail are started once; the group runs alongside the rest of the suite.
+    """
+
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.requires_api
-    async def test_diagnose_patch_generation(self, diag_client):
+    async def test_diagnose_patch_generation(self, diag_client, diag_workspace: Path):
         """Run a file write operation and diagnose patch generation."""
         client, server_info = diag_client
-        workspace = server_info["workspace"]
+        workspace = diag_workspace
         log_file = server_info["log_file"]
 
         # Create session
         session_id = await client.create_session(workspace=str(workspace))
-        print(f"\n[Diag] Session: {session_id}")
-        print(f"[Diag] Workspace: {workspace}")
+        log.debug("Session: %s", session_id)
+        log.debug("Workspace: %s", workspace)
 
         try:
             # Execute file write prompt
@@ -376,47 +560,43 @@ class TestSidecarSSEDiagnostics:
                 "don't explain anything."
             )
 
-            print(f"[Diag] Executing prompt...")
+            log.debug("Executing prompt...")
             response = await client.execute_simple(session_id, prompt, timeout_secs=120)
-            print(f"[Diag] Response: {response[:200]}...")
+            log.debug("Response: %.200s...", response)
 
         finally:
-            # Delete session to trigger EndSession
-            print("[Diag] Deleting session to trigger EndSession...")
-            await client.delete_session(session_id)
-
-        # Give async processor time to complete
-        import asyncio
-        await asyncio.sleep(2)
+            # Wait until the processor has handled every captured event, so
+            # its log lines are on disk before we parse them
+            log.debug("Flushing sidecar and deleting session...")
+            try:
+                await client.flush_sidecar(session_id)
+            finally:
+                await client.delete_session(session_id)
 
-        # Read and parse logs
-        logs = log_file.read_text()
-        diag = parse_logs(logs)
+        # Parse logs
+        diag = server_info["log_tail"].update()
 
-        # Print summary
-        print("\n" + diag.summary())
+        log.debug("\n%s", diag.summary())
 
         # Check if file was created
         test_file = workspace / "test.txt"
         if test_file.exists():
-            print(f"\n✓ File created: {test_file}")
-            print(f"  Content: {test_file.read_text()[:100]}")
+            log.debug("✓ File created: %s\n  Content: %.100s", test_file, test_file.read_text())
         else:
-            print(f"\n✗ File not created: {test_file}")
+            log.debug("✗ File not created: %s", test_file)
 
-        # Save full logs
-        print(f"\nFull logs at: {log_file}")
+        log.debug("Full logs at: %s", log_file)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.requires_api
-    async def test_diagnose_multiple_files(self, diag_client):
+    async def test_diagnose_multiple_files(self, diag_client, diag_workspace: Path):
         """Test with multiple file operations to trigger boundary detection."""
         client, server_info = diag_client
-        workspace = server_info["workspace"]
+        workspace = diag_workspace
         log_file = server_info["log_file"]
 
         session_id = await client.create_session(workspace=str(workspace))
-        print(f"\n[Diag] Session: {session_id}")
+        log.debug("Session: %s", session_id)
 
         try:
             # Create multiple files to exceed min_events threshold (3)
@@ -426,51 +606,43 @@ class TestSidecarSSEDiagnostics:
                 "Create all three files. Don't explain, just do it."
             )
 
-            print(f"[Diag] Executing prompt...")
+            log.debug("Executing prompt...")
             response = await client.execute_simple(session_id, prompt, timeout_secs=180)
-            print(f"[Diag] Response: {response[:200]}...")
+            log.debug("Response: %.200s...", response)
 
         finally:
-            await client.delete_session(session_id)
-
-        import asyncio
-        await asyncio.sleep(2)
+            try:
+                await client.flush_sidecar(session_id)
+            finally:
+                await client.delete_session(session_id)
 
-        logs = log_file.read_text()
-        diag = parse_logs(logs)
+        diag = server_info["log_tail"].update()
 
-        print("\n" + diag.summary())
+        log.debug("\n%s", diag.summary())
 
-        # Check which files were created
-        files_created = []
-        for i in range(1, 4):
-            f = workspace / f"file{i}.txt"
-            if f.exists():
-                files_created.append(f.name)
+        # Check which files were created (one directory listing, not a stat per file)
+        with os.scandir(workspace) as entries:
+            names = {entry.name for entry in entries}
+        files_created = [
+            name for name in (f"file{i}.txt" for i in range(1, 4)) if name in names
+        ]
 
-        print(f"\nFiles created in workspace: {files_created}")
-        print(f"Full logs at: {log_file}")
+        log.debug("Files created in workspace: %s", files_created)
+        log.debug("Full logs at: %s", log_file)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.requires_api
-    async def test_diagnose_edit_operation(self, diag_client):
+    async def test_diagnose_edit_operation(self, diag_client, diag_workspace: Path):
         """Test with an edit operation to check diff tracking."""
         client, server_info = diag_client
-        workspace = server_info["workspace"]
+        workspace = diag_workspace
         log_file = server_info["log_file"]
 
-        # First create a file to edit
+        # edit_target.txt is committed by the workspace setup
         test_file = workspace / "edit_target.txt"
-        test_file.write_text("Line 1\nLine 2\nLine 3\n")
-        subprocess.run(["git", "add", "."], cwd=workspace, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Add edit target"],
-            cwd=workspace,
-            capture_output=True,
-        )
 
         session_id = await client.create_session(workspace=str(workspace))
-        print(f"\n[Diag] Session: {session_id}")
+        log.debug("Session: %s", session_id)
 
         try:
             prompt = (
@@ -478,27 +650,26 @@ class TestSidecarSSEDiagnostics:
                 "Don't explain, just make the edit."
             )
 
-            print(f"[Diag] Executing prompt...")
+            log.debug("Executing prompt...")
             response = await client.execute_simple(session_id, prompt, timeout_secs=120)
-            print(f"[Diag] Response: {response[:200]}...")
+            log.debug("Response: %.200s...", response)
 
         finally:
-            await client.delete_session(session_id)
-
-        import asyncio
-        await asyncio.sleep(2)
+            try:
+                await client.flush_sidecar(session_id)
+            finally:
+                await client.delete_session(session_id)
 
-        logs = log_file.read_text()
-        diag = parse_logs(logs)
+        diag = server_info["log_tail"].update()
 
-        print("\n" + diag.summary())
+        log.debug("\n%s", diag.summary())
 
         # Check if file was modified
         if test_file.exists():
             content = test_file.read_text()
-            print(f"\nFile content after edit:\n{content}")
+            log.debug("File content after edit:\n%s", content)
 
-        print(f"Full logs at: {log_file}")
+        log.debug("Full logs at: %s", log_file)
 
 
 # =============================================================================
@@ -520,12 +691,12 @@ class TestSidecarWithExistingRunner:
 
         result = await runner.run(prompt)
 
-        print(f"\n[Test] Success: {result.success}")
-        print(f"[Test] Response: {result.response[:200]}...")
-        print(f"[Test] Tool calls: {len(result.tool_calls)}")
+        log.debug("Success: %s", result.success)
+        log.debug("Response: %.200s...", result.response)
+        log.debug("Tool calls: %d", len(result.tool_calls))
 
         for tc in result.tool_calls:
-            print(f"  - {tc.get('name', 'unknown')}")
+            log.debug("  - %s", tc.get("name", "unknown"))
 
         # The actual sidecar behavior can be verified by checking RUST_LOG output
         # or by checking for patches in the session directory
@@ -541,12 +712,12 @@ class TestSidecarWithExistingRunner:
 
         result = await runner.run(prompt)
 
-        print(f"\n[Test] Success: {result.success}")
-        print(f"[Test] Tool calls: {len(result.tool_calls)}")
+        log.debug("Success: %s", result.success)
+        log.debug("Tool calls: %d", len(result.tool_calls))
 
         for tc in result.tool_calls:
-            print(f"  - {tc.get('name', 'unknown')}: {tc.get('input', {}).get('path', 'N/A')}")
+            log.debug("  - %s: %s", tc.get("name", "unknown"), tc.get("input", {}).get("path", "N/A"))
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
+    pytest.main([__file__, "-v", "-o", "log_cli=true", "--log-cli-level=DEBUG"])
@@ -2,19 +2,151 @@
 """Print N digits of pi."""
 
 import argparse
-from mpmath import mp
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; cache writes go unlocked
+    fcntl = None
+
+# Longest expansion computed so far; shorter requests are served as a prefix
+CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "qbit"
+    / "pi_digits.txt"
+)
+
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# math.pi is a double, exact to this many digits; smaller requests skip mpmath
+FLOAT_PI_DIGITS = 15
+
+
+def load_gmpy2():
+    """Import gmpy2 on first use, or return None if it is not installed.
+
+    Deferred like mpmath, so requests served from math.pi never load it.
+    """
+    try:
+        import gmpy2
+    except ImportError:  # Optional: MPFR's const_pi is much faster for large N
+        return None
+    return gmpy2
+
+
+def pi_digits(n):
+    """Return pi to n digits as printed, e.g. "3.14" for n=3."""
+    if n <= FLOAT_PI_DIGITS:
+        return f"{math.pi:.{FLOAT_PI_DIGITS}f}"[:n + 1]
+
+    gmpy2 = load_gmpy2()
+    if gmpy2 is not None:
+        # ~log2(10) bits per decimal digit, plus guard digits so the
+        # digits we keep are never affected by rounding
+        gmpy2.get_context().precision = int((n + 10) * 3.33)
+        mantissa, _, _ = gmpy2.const_pi().digits(10, n + 10)
+        return f"{mantissa[0]}.{mantissa[1:n]}"
+
+    from mpmath import mp  # Deferred: importing mpmath dominates startup for small N
+
+    # Guard digits keep rounding away from the digits we keep; strip_zeros
+    # must be off or a run of trailing zeros would shorten the output
+    mp.dps = n + 10
+    return mp.nstr(mp.pi, n + 10, strip_zeros=False)[:n + 1]  # +1 for the "3."
+
+
+def read_cached(n):
+    """Return pi to n digits from the cache, or None if it holds fewer."""
+    try:
+        with open(CACHE_PATH, encoding="ascii") as f:
+            digits = f.read(n + 1)
+    except OSError:
+        return None
+    return digits if len(digits) == n + 1 else None
+
+
+def write_cache(digits):
+    """Store digits in the cache unless it already holds at least as many."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH.with_suffix(".lock"), "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if CACHE_PATH.stat().st_size >= len(digits):
+                    return
+            except FileNotFoundError:
+                pass
+            tmp = CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(digits, encoding="ascii")
+            os.replace(tmp, CACHE_PATH)
+    except OSError:
+        pass  # The cache is best effort; never fail the actual output
+
+
+def write_digits(digits):
+    """Write digits and a newline to stdout in fixed-size chunks."""
+    out = sys.stdout.buffer
+    view = memoryview(digits.encode("ascii"))
+    for start in range(0, len(view), WRITE_CHUNK_SIZE):
+        out.write(view[start:start + WRITE_CHUNK_SIZE])
+    out.write(b"\n")
+    out.flush()
+
+
+def backend_name(n):
+    """Name the code path pi_digits takes for n digits."""
+    if n <= FLOAT_PI_DIGITS:
+        return "math.pi"
+    if load_gmpy2() is not None:
+        return "gmpy2 const_pi"
+    from mpmath import libmp  # mpmath picks gmpy2 or pure Python ints at import
+
+    return f"mpmath ({libmp.BACKEND} backend)"
+
+
+def profile_digits(n):
+    """Compute pi to n digits under cProfile, reporting the hot path on stderr."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    digits = profiler.runcall(pi_digits, n)
+    elapsed = time.perf_counter() - start
+
+    print(f"pi_digits({n}) via {backend_name(n)}: {elapsed:.3f}s (profiled)", file=sys.stderr)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(15)
+    return digits
 
 
 def main():
     parser = argparse.ArgumentParser(description="Print N digits of pi")
     parser.add_argument("n", type=int, help="Number of digits to print")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Bypass the cache and print a cProfile report of the computation to stderr",
+    )
     args = parser.parse_args()
 
     if args.n < 1:
         parser.error("N must be at least 1")
 
-    mp.dps = args.n + 1  # Extra precision to avoid rounding issues
-    print(str(mp.pi)[:args.n + 1])  # +1 for the "3."
+    if args.profile:
+        digits = profile_digits(args.n)
+    elif args.n <= FLOAT_PI_DIGITS:
+        digits = pi_digits(args.n)  # Cheaper than reading the cache
+    else:
+        digits = read_cached(args.n)
+        if digits is None:
+            digits = pi_digits(args.n)
+            write_cache(digits)
+    write_digits(digits)
 
 
 if __name__ == "__main__":
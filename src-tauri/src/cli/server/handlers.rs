@@ -432,6 +432,55 @@ pub async fn execute(
     ))
 }
 
+// =============================================================================
+// API-8: Flush Sidecar
+// =============================================================================
+
+/// Wait for a session's sidecar to finish processing captured events.
+///
+/// Returns once every event captured so far has been applied to the session's
+/// `state.md` and `log.md`, so callers can inspect sidecar files without
+/// sleeping for an arbitrary delay.
+///
+/// # Path Parameters
+///
+/// - `session_id`: The session whose sidecar should be flushed
+///
+/// # Response
+///
+/// - `204 No Content`: Pending sidecar events have been processed
+/// - `404 Not Found`: Session does not exist
+pub async fn flush_sidecar(
+    State(state): State<Arc<AppState>>,
+    Path(session_id): Path<String>,
+) -> Result<StatusCode, (StatusCode, Json<ErrorResponse>)> {
+    let session = state.session_manager.get(&session_id).ok_or_else(|| {
+        (
+            StatusCode::NOT_FOUND,
+            Json(ErrorResponse::with_code(
+                format!("Session '{}' not found", session_id),
+                "SESSION_NOT_FOUND",
+            )),
+        )
+    })?;
+
+    session.touch().await;
+
+    // Clone the sidecar handle so the context lock is not held while waiting
+    let sidecar_state = session
+        .context
+        .read()
+        .await
+        .as_ref()
+        .map(|ctx| ctx.sidecar_state.clone());
+
+    if let Some(sidecar_state) = sidecar_state {
+        sidecar_state.flush().await;
+    }
+
+    Ok(StatusCode::NO_CONTENT)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -459,6 +508,10 @@ mod tests {
                 "/sessions/{session_id}/execute",
                 axum::routing::post(execute),
             )
+            .route(
+                "/sessions/{session_id}/sidecar/flush",
+                axum::routing::post(flush_sidecar),
+            )
             .with_state(state)
     }
 
@@ -624,6 +677,53 @@ mod tests {
 
             assert_eq!(response.status(), StatusCode::NOT_FOUND);
         }
+
+        #[tokio::test]
+        async fn flush_sidecar_nonexistent_session_returns_404() {
+            let app = create_test_app();
+
+            let response = app
+                .oneshot(
+                    Request::builder()
+                        .method("POST")
+                        .uri("/sessions/nonexistent-id/sidecar/flush")
+                        .body(Body::empty())
+                        .unwrap(),
+                )
+                .await
+                .unwrap();
+
+            assert_eq!(response.status(), StatusCode::NOT_FOUND);
+        }
+
+        #[tokio::test]
+        async fn flush_sidecar_existing_session_returns_204() {
+            // A session without a CLI context has no sidecar to wait for, so
+            // this covers the success response rather than the flush itself
+            let (state, _shutdown) = AppState::new(10, std::path::PathBuf::from("/tmp"));
+            let session = state.session_manager.create().unwrap();
+            let session_id = session.id.clone();
+
+            let app = Router::new()
+                .route(
+                    "/sessions/{session_id}/sidecar/flush",
+                    axum::routing::post(flush_sidecar),
+                )
+                .with_state(state);
+
+            let response = app
+                .oneshot(
+                    Request::builder()
+                        .method("POST")
+                        .uri(format!("/sessions/{}/sidecar/flush", session_id))
+                        .body(Body::empty())
+                        .unwrap(),
+                )
+                .await
+                .unwrap();
+
+            assert_eq!(response.status(), StatusCode::NO_CONTENT);
+        }
     }
 
     // =========================================================================
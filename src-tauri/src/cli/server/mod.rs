@@ -17,6 +17,7 @@
 //! |  /sessions/{id} (GET) -> get session     |
 //! |  /sessions/{id} (DELETE) -> delete       |
 //! |  /sessions/{id}/execute (POST) -> SSE    |
+//! |  /sessions/{id}/sidecar/flush (POST)     |
 //! +------------------------------------------+
 //!          |
 //!          v
@@ -45,6 +46,7 @@
 //! | GET | /sessions/:id | Get session info |
 //! | DELETE | /sessions/:id | Delete session |
 //! | POST | /sessions/:id/execute | Execute prompt (SSE) |
+//! | POST | /sessions/:id/sidecar/flush | Wait for sidecar processing |
 //!
 //! # Feature Flag
 //!
@@ -159,6 +161,10 @@ pub fn create_router(state: Arc<AppState>) -> Router {
         .route("/sessions/{session_id}", get(handlers::get_session))
         .route("/sessions/{session_id}", delete(handlers::delete_session))
         .route("/sessions/{session_id}/execute", post(handlers::execute))
+        .route(
+            "/sessions/{session_id}/sidecar/flush",
+            post(handlers::flush_sidecar),
+        )
         .with_state(state)
 }
 
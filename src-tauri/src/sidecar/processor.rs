@@ -5,12 +5,12 @@
 //! - `patches/staged/` with commit patches (L2)
 
 use anyhow::{Context, Result};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 #[cfg(feature = "tauri")]
 use std::sync::Arc;
 
-use tokio::sync::mpsc;
+use tokio::sync::{mpsc, oneshot};
 
 #[cfg(feature = "tauri")]
 use tauri::AppHandle;
@@ -34,6 +34,8 @@ pub enum ProcessorTask {
     },
     /// End a session
     EndSession { session_id: String },
+    /// Signal `done` once every task queued before this one has been handled
+    Flush { done: oneshot::Sender<()> },
     /// Shutdown the processor
     Shutdown,
 }
@@ -96,17 +98,19 @@ impl ProcessorConfig {
 /// Tracks file changes for patch generation
 #[derive(Debug, Default)]
 struct FileChangeTracker {
-    /// Files changed since last commit boundary
+    /// Files changed since last commit boundary, in first-seen order
     files: Vec<PathBuf>,
+    /// Index of `files` for constant-time duplicate checks
+    seen: HashSet<PathBuf>,
 }
 
 impl FileChangeTracker {
     fn new() -> Self {
-        Self { files: Vec::new() }
+        Self::default()
     }
 
     fn record_change(&mut self, path: PathBuf) {
-        if !self.files.contains(&path) {
+        if self.seen.insert(path.clone()) {
             self.files.push(path);
         }
     }
@@ -115,8 +119,13 @@ impl FileChangeTracker {
         self.files.clone()
     }
 
+    fn len(&self) -> usize {
+        self.files.len()
+    }
+
     fn clear(&mut self) {
         self.files.clear();
+        self.seen.clear();
     }
 
     #[allow(dead_code)]
@@ -133,10 +142,14 @@ struct SessionProcessorState {
     file_tracker: FileChangeTracker,
     /// All files modified during session (for state.md updates)
     all_modified_files: Vec<PathBuf>,
+    /// Index of `all_modified_files` for constant-time duplicate checks
+    all_modified_seen: HashSet<PathBuf>,
     /// Tool calls completed during session (for progress tracking)
     completed_tools: Vec<String>,
     /// Event count for this session
     event_count: u32,
+    /// Formatted log.md entries not yet written to disk
+    pending_log: Vec<String>,
 }
 
 impl SessionProcessorState {
@@ -145,14 +158,16 @@ impl SessionProcessorState {
             boundary_detector: CommitBoundaryDetector::new(),
             file_tracker: FileChangeTracker::new(),
             all_modified_files: Vec::new(),
+            all_modified_seen: HashSet::new(),
             completed_tools: Vec::new(),
             event_count: 0,
+            pending_log: Vec::new(),
         }
     }
 
     /// Record a modified file (deduplicates)
     fn record_modified_file(&mut self, path: PathBuf) {
-        if !self.all_modified_files.contains(&path) {
+        if self.all_modified_seen.insert(path.clone()) {
             self.all_modified_files.push(path);
         }
     }
@@ -217,6 +232,26 @@ impl Processor {
         }
     }
 
+    /// Wait until every task queued before this call has been processed
+    ///
+    /// The returned future does not borrow the processor, so callers can release
+    /// any lock guarding it before awaiting.
+    pub fn flush(&self) -> impl std::future::Future<Output = ()> + Send + 'static {
+        let task_tx = self.task_tx.clone();
+        async move {
+            let (done_tx, done_rx) = oneshot::channel();
+            if task_tx
+                .send(ProcessorTask::Flush { done: done_tx })
+                .await
+                .is_err()
+            {
+                tracing::warn!("[processor] Failed to queue flush: processor stopped");
+                return;
+            }
+            let _ = done_rx.await;
+        }
+    }
+
     /// Shutdown the processor and wait for it to complete all pending work
     ///
     /// This sends a shutdown signal and then waits for the processor task to finish,
@@ -235,7 +270,14 @@ impl Processor {
     }
 }
 
+/// Maximum number of log.md entries buffered per session before they are written
+const LOG_BATCH_SIZE: usize = 64;
+
 /// Main processor loop
+///
+/// log.md entries are buffered per session and written in one append once the
+/// task queue drains, a session's buffer reaches `LOG_BATCH_SIZE`, or a task
+/// that needs them on disk (EndSession, Flush, Shutdown) arrives.
 async fn run_processor(config: ProcessorConfig, mut task_rx: mpsc::Receiver<ProcessorTask>) {
     tracing::info!("Sidecar processor started");
 
@@ -251,6 +293,10 @@ async fn run_processor(config: ProcessorConfig, mut task_rx: mpsc::Receiver<Proc
                 if let Err(e) = handle_event(&config, &session_id, &event, session_state).await {
                     tracing::error!("Failed to process event for {}: {}", session_id, e);
                 }
+
+                if session_state.pending_log.len() >= LOG_BATCH_SIZE {
+                    flush_session_log(&config, &session_id, session_state).await;
+                }
             }
             ProcessorTask::EndSession { session_id } => {
                 tracing::info!(
@@ -260,6 +306,8 @@ async fn run_processor(config: ProcessorConfig, mut task_rx: mpsc::Receiver<Proc
 
                 // Generate final patch if there are pending changes
                 if let Some(session_state) = session_states.get_mut(&session_id) {
+                    flush_session_log(&config, &session_id, session_state).await;
+
                     tracing::info!(
                         "[processor] Session {} ending: generate_patches={}",
                         session_id,
@@ -304,11 +352,49 @@ async fn run_processor(config: ProcessorConfig, mut task_rx: mpsc::Receiver<Proc
 
                 session_states.remove(&session_id);
             }
+            ProcessorTask::Flush { done } => {
+                flush_all_session_logs(&config, &mut session_states).await;
+                tracing::debug!("[processor] Flush complete");
+                let _ = done.send(());
+            }
             ProcessorTask::Shutdown => {
+                flush_all_session_logs(&config, &mut session_states).await;
                 tracing::info!("Sidecar processor shutting down");
                 break;
             }
         }
+
+        // Coalesce bursts of events into one write per session
+        if task_rx.is_empty() {
+            flush_all_session_logs(&config, &mut session_states).await;
+        }
+    }
+}
+
+/// Write a session's buffered log.md entries in one append
+async fn flush_session_log(
+    config: &ProcessorConfig,
+    session_id: &str,
+    session_state: &mut SessionProcessorState,
+) {
+    if session_state.pending_log.is_empty() {
+        return;
+    }
+
+    let entries = std::mem::take(&mut session_state.pending_log);
+    let session_dir = config.sessions_dir.join(session_id);
+    if let Err(e) = Session::append_log_entries(&session_dir, &entries).await {
+        tracing::warn!("Failed to append to log: {}", e);
+    }
+}
+
+/// Write buffered log.md entries for every session
+async fn flush_all_session_logs(
+    config: &ProcessorConfig,
+    session_states: &mut HashMap<String, SessionProcessorState>,
+) {
+    for (session_id, session_state) in session_states.iter_mut() {
+        flush_session_log(config, session_id, session_state).await;
     }
 }
 
@@ -385,9 +471,9 @@ async fn update_session_files(
                 format_operation(operation),
                 path.display()
             );
-            if let Err(e) = session.append_log(&log_entry).await {
-                tracing::warn!("Failed to append to log: {}", e);
-            }
+            session_state
+                .pending_log
+                .push(Session::format_log_entry(&log_entry));
 
             // Note: State synthesis happens on AiResponse, not per-file-edit
         }
@@ -419,9 +505,9 @@ async fn update_session_files(
                 log_entry.push_str(&format!("- **Result**:\n```\n{}\n```\n", truncated));
             }
 
-            if let Err(e) = session.append_log(&log_entry).await {
-                tracing::warn!("Failed to append to log: {}", e);
-            }
+            session_state
+                .pending_log
+                .push(Session::format_log_entry(&log_entry));
 
             // Track tool call for progress (state will be synthesized on AiResponse)
             session_state.record_tool_call(tool_name, *success);
@@ -442,9 +528,9 @@ async fn update_session_files(
                 intent.clone()
             };
             let log_entry = format!("**User**: {}", truncated);
-            if let Err(e) = session.append_log(&log_entry).await {
-                tracing::warn!("Failed to append to log: {}", e);
-            }
+            session_state
+                .pending_log
+                .push(Session::format_log_entry(&log_entry));
 
             // Update state.md with new user request via LLM synthesis
             tracing::info!(
@@ -482,9 +568,9 @@ async fn update_session_files(
                 content.clone()
             };
             let log_entry = format!("**Agent**: {}", truncated);
-            if let Err(e) = session.append_log(&log_entry).await {
-                tracing::warn!("Failed to append to log: {}", e);
-            }
+            session_state
+                .pending_log
+                .push(Session::format_log_entry(&log_entry));
 
             // Trigger LLM-based state synthesis on AI responses (completed turns)
             tracing::info!(
@@ -896,7 +982,7 @@ fn track_file_changes(event: &SessionEvent, session_state: &mut SessionProcessor
     }
     tracing::debug!(
         "[processor] File tracker now has {} file(s)",
-        session_state.file_tracker.get_files().len()
+        session_state.file_tracker.len()
     );
 }
 
@@ -1168,6 +1254,114 @@ mod tests {
         processor.shutdown().await;
     }
 
+    #[tokio::test]
+    async fn test_processor_flush_waits_for_queued_tasks() {
+        let temp = TempDir::new().unwrap();
+        let config = ProcessorConfig {
+            sessions_dir: temp.path().to_path_buf(),
+            generate_patches: false,
+            synthesis: SynthesisConfig::default(),
+            #[cfg(feature = "tauri")]
+            app_handle: None,
+        };
+
+        let session = Session::create(
+            temp.path(),
+            "flush-test".to_string(),
+            temp.path().to_path_buf(),
+            "Flush ordering".to_string(),
+        )
+        .await
+        .unwrap();
+
+        let processor = Processor::spawn(config);
+        processor.process_event(
+            "flush-test".to_string(),
+            SessionEvent::file_edit(
+                "flush-test".to_string(),
+                PathBuf::from("queued.rs"),
+                super::super::events::FileOperation::Create,
+                None,
+            ),
+        );
+
+        tokio::time::timeout(std::time::Duration::from_secs(5), processor.flush())
+            .await
+            .expect("flush should complete once queued tasks are handled");
+
+        // Flush must not overtake the event queued before it
+        let log = session.read_log().await.unwrap();
+        assert!(
+            log.contains("**File created**: `queued.rs`"),
+            "queued event should be in log.md when flush returns, got:\n{}",
+            log
+        );
+
+        processor.shutdown().await;
+    }
+
+    #[tokio::test]
+    async fn test_processor_writes_batched_log_entries_in_order() {
+        let temp = TempDir::new().unwrap();
+        let config = ProcessorConfig {
+            sessions_dir: temp.path().to_path_buf(),
+            generate_patches: false,
+            synthesis: SynthesisConfig::default(),
+            #[cfg(feature = "tauri")]
+            app_handle: None,
+        };
+
+        let session = Session::create(
+            temp.path(),
+            "batch-test".to_string(),
+            temp.path().to_path_buf(),
+            "Batch log writes".to_string(),
+        )
+        .await
+        .unwrap();
+
+        // Queue more than one batch before the processor runs, so entries are
+        // written both at LOG_BATCH_SIZE and when the queue drains
+        let processor = Processor::spawn(config);
+        let count = LOG_BATCH_SIZE + 3;
+        let mut expected = Vec::with_capacity(count);
+        for i in 0..count {
+            let path = format!("file_{}.rs", i);
+            let event = if i % 2 == 0 {
+                expected.push(format!("**File modified**: `{}`", path));
+                SessionEvent::file_edit(
+                    "batch-test".to_string(),
+                    PathBuf::from(&path),
+                    super::super::events::FileOperation::Modify,
+                    None,
+                )
+            } else {
+                expected.push(format!("- **Args**: `path={}`", path));
+                SessionEvent::tool_call(
+                    "batch-test".to_string(),
+                    "read_file",
+                    Some(format!("path={}", path)),
+                    None,
+                    true,
+                )
+            };
+            processor.process_event("batch-test".to_string(), event);
+        }
+
+        processor.flush().await;
+
+        let log = session.read_log().await.unwrap();
+        let mut offset = 0;
+        for entry in &expected {
+            let found = log[offset..]
+                .find(entry.as_str())
+                .unwrap_or_else(|| panic!("missing or out of order: {}", entry));
+            offset += found + entry.len();
+        }
+
+        processor.shutdown().await;
+    }
+
     #[test]
     fn test_file_change_tracker_records_unique_paths() {
         let mut tracker = FileChangeTracker::new();
@@ -1190,6 +1384,10 @@ mod tests {
 
         tracker.clear();
         assert!(tracker.is_empty());
+
+        // A cleared path is tracked again after the next boundary
+        tracker.record_change(PathBuf::from("src/main.rs"));
+        assert_eq!(tracker.len(), 1);
     }
 
     #[test]
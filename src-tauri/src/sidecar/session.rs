@@ -248,12 +248,24 @@ impl Session {
 
     /// Append an entry to log.md
     pub async fn append_log(&self, entry: &str) -> Result<()> {
-        use tokio::io::AsyncWriteExt;
+        Self::append_log_entries(&self.dir, &[Self::format_log_entry(entry)]).await
+    }
 
-        let path = self.dir.join(Self::LOG_FILE);
+    /// Format a log.md entry stamped with the current time
+    pub fn format_log_entry(entry: &str) -> String {
         let timestamp = Utc::now().format("%Y-%m-%d %H:%M:%S UTC");
-        let formatted = format!("\n---\n\n**{}**\n\n{}\n", timestamp, entry);
+        format!("\n---\n\n**{}**\n\n{}\n", timestamp, entry)
+    }
+
+    /// Append pre-formatted entries to a session's log.md with a single write
+    pub async fn append_log_entries(session_dir: &Path, entries: &[String]) -> Result<()> {
+        use tokio::io::AsyncWriteExt;
+
+        if entries.is_empty() {
+            return Ok(());
+        }
 
+        let path = session_dir.join(Self::LOG_FILE);
         let mut file = tokio::fs::OpenOptions::new()
             .create(true)
             .append(true)
@@ -261,7 +273,7 @@ impl Session {
             .await
             .context("Failed to open log.md")?;
 
-        file.write_all(formatted.as_bytes())
+        file.write_all(entries.concat().as_bytes())
             .await
             .context("Failed to append to log.md")?;
 
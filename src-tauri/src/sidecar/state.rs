@@ -400,6 +400,16 @@ impl SidecarState {
         }
     }
 
+    /// Wait for the processor to handle every event captured so far
+    ///
+    /// Returns immediately if the processor is not running.
+    pub async fn flush(&self) {
+        let flush = self.processor.read().unwrap().as_ref().map(|p| p.flush());
+        if let Some(flush) = flush {
+            flush.await;
+        }
+    }
+
     /// Get current configuration
     pub fn config(&self) -> SidecarConfig {
         self.config.read().unwrap().clone()